@@ -1,5 +1,6 @@
 from django.contrib import admin
 
+from .functions import clear_pages_cache
 from .models import Post, Category, Location
 
 
@@ -13,6 +14,14 @@ class PostAdmin(admin.ModelAdmin):
     list_filter = ('created_at',)
     empty_value_display = '-пусто-'
 
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        clear_pages_cache()
+
+    def delete_queryset(self, request, queryset):
+        super().delete_queryset(request, queryset)
+        clear_pages_cache()
+
 
 @admin.register(Category)
 class CategoryAdmin(admin.ModelAdmin):
@@ -1,11 +1,32 @@
+from django.core.cache import caches
 from django.utils.timezone import now
 
+POST_LIST_FIELDS = (
+    'title', 'text', 'pub_date', 'image', 'is_published', 'updated_at',
+    'comment_count',
+    'author__username',
+    'category__title', 'category__slug', 'category__is_published',
+    'location__name', 'location__is_published',
+)
 
-def get_post(posts):
-    return posts.select_related(
-        'author', 'category', 'location'
-    ).filter(
+
+def get_post_detail(posts):
+    return posts.select_related('author', 'category', 'location')
+
+
+def get_post_cards(posts):
+    return get_post_detail(posts).only(*POST_LIST_FIELDS).order_by(
+        '-pub_date', '-id'
+    )
+
+
+def get_post_list(posts):
+    return get_post_cards(posts).filter(
         is_published=True,
         category__is_published=True,
-        pub_date__date__lt=now()
+        pub_date__lt=now()
     )
+
+
+def clear_pages_cache():
+    caches['pages'].clear()
@@ -0,0 +1,17 @@
+# Generated by Django 3.2.16 on 2026-10-15 08:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0012_rename_comment_comment_comments'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['-pub_date', '-id'], name='post_pub_date_id_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 3.2.16 on 2026-10-15 08:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0013_post_pub_date_id_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(fields=['is_published', 'slug'], name='category_pub_slug_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['is_published', '-pub_date', '-id'], name='post_pub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['-pub_date', '-id'], name='post_pub_published_idx'),
+        ),
+    ]
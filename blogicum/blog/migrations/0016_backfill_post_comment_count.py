@@ -0,0 +1,31 @@
+# Generated by Django 3.2.16 on 2026-10-15 08:07
+
+from django.db import migrations
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_comment_count(apps, schema_editor):
+    Post = apps.get_model('blog', 'Post')
+    Comment = apps.get_model('blog', 'Comment')
+    comments = Comment.objects.filter(
+        comments=OuterRef('pk')
+    ).order_by().values('comments').annotate(
+        count=Count('pk')
+    ).values('count')
+    Post.objects.update(comment_count=Coalesce(
+        Subquery(comments, output_field=IntegerField()), 0
+    ))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0015_post_comment_count'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            backfill_comment_count, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 3.2.16 on 2026-10-15 08:12
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0016_backfill_post_comment_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now, verbose_name='Изменено'),
+            preserve_default=False,
+        ),
+    ]
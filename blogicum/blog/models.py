@@ -30,6 +30,11 @@ class Category(BaseModel):
     class Meta:
         verbose_name = 'категория'
         verbose_name_plural = 'Категории'
+        indexes = (
+            models.Index(
+                fields=('is_published', 'slug'), name='category_pub_slug_idx'
+            ),
+        )
 
     def __str__(self):
         return self.title[:settings.NUMBER_OF_SYMBOLS]
@@ -80,14 +85,49 @@ class Post(BaseModel):
         'Картинка для публикации',
         blank=True
     )
+    updated_at = models.DateTimeField('Изменено', auto_now=True)
+    comment_count = models.PositiveIntegerField(
+        'Количество комментариев',
+        default=0,
+        editable=False
+    )
 
     class Meta:
         verbose_name = 'публикация'
         verbose_name_plural = 'Публикации'
+        indexes = (
+            models.Index(
+                fields=('-pub_date', '-id'), name='post_pub_date_id_idx'
+            ),
+            models.Index(
+                fields=('is_published', '-pub_date', '-id'),
+                name='post_pub_idx'
+            ),
+            models.Index(
+                fields=('-pub_date', '-id'),
+                condition=models.Q(is_published=True),
+                name='post_pub_published_idx'
+            ),
+        )
 
     def __str__(self):
         return self.title[:settings.NUMBER_OF_SYMBOLS]
 
+    def save(self, force_insert=False, force_update=False, using=None,
+             update_fields=None):
+        # comment_count меняется только через F(): полное сохранение
+        # загруженной записи не должно затирать его устаревшим значением.
+        if (self.pk is not None and not self._state.adding
+                and not force_insert and update_fields is None):
+            deferred = self.get_deferred_fields()
+            update_fields = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.name != 'comment_count'
+                and field.attname not in deferred
+            ]
+        super().save(force_insert, force_update, using, update_fields)
+
 
 class Comment(models.Model):
     text = models.TextField('Текст комментария')
@@ -0,0 +1,129 @@
+import hashlib
+from collections.abc import Sequence
+from datetime import datetime, timedelta, timezone
+
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db.models import Q
+from django.utils.functional import cached_property
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(obj, date_field='pub_date'):
+    """Курсор вида `<микросекунды даты>_<id>`"""
+    micros = (getattr(obj, date_field) - EPOCH) // timedelta(microseconds=1)
+    return f'{micros}_{obj.id}'
+
+
+def decode_cursor(cursor):
+    try:
+        micros, obj_id = cursor.split('_')
+        return EPOCH + timedelta(microseconds=int(micros)), int(obj_id)
+    except (ValueError, OverflowError):
+        raise InvalidCursor(cursor)
+
+
+class KeysetPage(Sequence):
+    """Страница объектов, полученная по курсору"""
+
+    def __init__(self, object_list, has_next, has_previous,
+                 date_field='pub_date'):
+        self.object_list = object_list
+        self._has_next = has_next
+        self._has_previous = has_previous
+        self.date_field = date_field
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self._has_previous
+
+    def has_other_pages(self):
+        return self._has_next or self._has_previous
+
+    @property
+    def next_cursor(self):
+        if self._has_next:
+            return encode_cursor(self.object_list[-1], self.date_field)
+        return None
+
+    @property
+    def previous_cursor(self):
+        if self._has_previous:
+            return encode_cursor(self.object_list[0], self.date_field)
+        return None
+
+
+class KeysetPaginator:
+    """Пагинация по ключу (дата, id) без OFFSET и COUNT(*)"""
+
+    def __init__(self, object_list, per_page, date_field='pub_date'):
+        self.object_list = object_list
+        self.per_page = per_page
+        self.date_field = date_field
+
+    def page(self, after=None, before=None):
+        if before and not after:
+            return self._page_before(before)
+        objects = self.object_list.order_by(f'-{self.date_field}', '-id')
+        if after:
+            date, obj_id = decode_cursor(after)
+            objects = objects.filter(
+                Q(**{f'{self.date_field}__lt': date})
+                | Q(**{self.date_field: date, 'id__lt': obj_id})
+            )
+        object_list = list(objects[:self.per_page + 1])
+        has_next = len(object_list) > self.per_page
+        return KeysetPage(
+            object_list[:self.per_page], has_next, bool(after),
+            self.date_field,
+        )
+
+    def _page_before(self, before):
+        date, obj_id = decode_cursor(before)
+        objects = self.object_list.order_by(self.date_field, 'id').filter(
+            Q(**{f'{self.date_field}__gt': date})
+            | Q(**{self.date_field: date, 'id__gt': obj_id})
+        )
+        object_list = list(objects[:self.per_page + 1])
+        has_previous = len(object_list) > self.per_page
+        return KeysetPage(
+            object_list[:self.per_page][::-1], True, has_previous,
+            self.date_field,
+        )
+
+
+class CachedCountPaginator(Paginator):
+    """Постраничная пагинация с кешированием COUNT(*) для больших выборок"""
+
+    count_cache_timeout = 300
+    count_cache_threshold = 1000
+
+    def __init__(self, *args, count_cache_key=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.count_cache_key = count_cache_key
+
+    @cached_property
+    def count(self):
+        key = 'paginator_count:' + hashlib.blake2b(
+            (self.count_cache_key or str(self.object_list.query)).encode(),
+            digest_size=16,
+        ).hexdigest()
+        count = cache.get(key)
+        if count is None:
+            count = super().count
+            if count > self.count_cache_threshold:
+                cache.set(key, count, self.count_cache_timeout)
+        return count
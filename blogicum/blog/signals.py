@@ -0,0 +1,25 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .functions import clear_pages_cache
+from .models import Category, Comment, Location, Post, User
+
+
+# Удаление публикаций и комментариев сбрасывает кеш явно во view и админке:
+# обработчик post_delete отключил бы быстрое каскадное удаление.
+@receiver(post_save, sender=Post)
+@receiver(post_save, sender=Comment)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Location)
+@receiver(post_delete, sender=Location)
+def clear_pages_cache_on_change(**kwargs):
+    clear_pages_cache()
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def clear_pages_cache_for_user(update_fields=None, **kwargs):
+    if update_fields is not None and set(update_fields) <= {'last_login'}:
+        return
+    clear_pages_cache()
@@ -1,18 +1,46 @@
-from django.db.models import Count
+from functools import lru_cache
+
+from django.db import transaction
+from django.db.models import F, Q
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth import get_user_model
+from django.http import Http404
 from django.shortcuts import get_object_or_404, redirect
+from django.utils.decorators import method_decorator
+from django.utils.functional import cached_property
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_cookie
 from django.views.generic import (CreateView, UpdateView, DeleteView,
                                   ListView, DetailView)
 from django.urls import reverse_lazy, reverse
+from django.conf import settings
 from django.utils.timezone import now
 
-from .functions import get_post
+from .functions import (clear_pages_cache, get_post_cards, get_post_detail,
+                        get_post_list)
 from .models import Post, Category, Comment
 from .forms import PostForm, CommentForm, EditProfileForm
+from .paginators import (CachedCountPaginator, InvalidCursor,
+                         KeysetPaginator)
 
 User = get_user_model()
 
+USERNAME_SENTINEL = '__username__'
+
+
+@lru_cache(maxsize=1024)
+def _post_detail_url(post_id):
+    return reverse('blog:post_detail', args=(post_id,))
+
+
+@lru_cache(maxsize=None)
+def _profile_url_template():
+    return reverse('blog:profile', args=(USERNAME_SENTINEL,))
+
+
+def _profile_url(username):
+    return _profile_url_template().replace(USERNAME_SENTINEL, username)
+
 
 class PostMixin():
     model = Post
@@ -22,13 +50,67 @@ class PostMixin():
 
 class DispatchMixin():
     def dispatch(self, request, *args, **kwargs):
-        obj = self.get_object()
-        if obj.author != self.request.user:
+        author_id = Post.objects.filter(
+            pk=self.kwargs['post_id']
+        ).values_list('author_id', flat=True).first()
+        if author_id is None:
+            raise Http404
+        if author_id != request.user.id:
             return redirect('blog:post_detail', post_id=self.kwargs['post_id'])
         return super().dispatch(request, *args, **kwargs)
 
 
-class IndexListView(ListView):
+class CommentMixin():
+    model = Comment
+    template_name = 'blog/comment.html'
+    pk_url_kwarg = 'comment_id'
+
+    def dispatch(self, request, *args, **kwargs):
+        try:
+            return super().dispatch(request, *args, **kwargs)
+        except Http404:
+            if not self.model.objects.filter(
+                pk=self.kwargs[self.pk_url_kwarg]
+            ).exists():
+                raise
+            return redirect('blog:post_detail', post_id=self.kwargs['post_id'])
+
+    def get_queryset(self):
+        return self.model.objects.filter(author_id=self.request.user.id)
+
+    def get_success_url(self):
+        return _post_detail_url(self.kwargs['post_id'])
+
+
+class KeysetPaginationMixin():
+    cursor_kwarg = 'after'
+    previous_cursor_kwarg = 'before'
+    paginator_class = CachedCountPaginator
+
+    def get_paginator(self, queryset, per_page, **kwargs):
+        return super().get_paginator(
+            queryset, per_page, count_cache_key=self.request.path, **kwargs
+        )
+
+    def paginate_queryset(self, queryset, page_size):
+        after = self.request.GET.get(self.cursor_kwarg)
+        before = self.request.GET.get(self.previous_cursor_kwarg)
+        if (after is None and before is None
+                and self.page_kwarg in self.request.GET):
+            return super().paginate_queryset(queryset, page_size)
+        paginator = KeysetPaginator(queryset, page_size)
+        try:
+            page = paginator.page(after=after, before=before)
+        except InvalidCursor:
+            raise Http404('Неверный курсор страницы')
+        return (paginator, page, page.object_list, page.has_other_pages())
+
+
+@method_decorator(
+    (cache_page(settings.PAGE_CACHE_TIMEOUT, cache='pages'), vary_on_cookie),
+    name='dispatch'
+)
+class IndexListView(KeysetPaginationMixin, ListView):
     """Главная страница"""
 
     model = Post
@@ -36,9 +118,7 @@ class IndexListView(ListView):
     template_name = 'blog/index.html'
 
     def get_queryset(self):
-        return get_post(Post.objects).annotate(
-            comment_count=Count('comments')
-        ).order_by('-pub_date')
+        return get_post_list(Post.objects)
 
 
 class PostDetailView(LoginRequiredMixin, DetailView):
@@ -48,50 +128,69 @@ class PostDetailView(LoginRequiredMixin, DetailView):
     pk_url_kwarg = 'post_id'
     form_class = PostForm
     template_name = 'blog/detail.html'
+    _cached_object = None
 
     def get_object(self, queryset=None):
-        self.post = get_object_or_404(Post, id=self.kwargs['post_id'])
-        if self.post.author == self.request.user:
-            return self.post
-        return get_object_or_404(
-            self.model.objects.select_related(
-                'location', 'author', 'category',
-            ).filter(
-                is_published=True,
-                pub_date__lte=now(),
-                category__is_published=True
+        if self._cached_object is not None:
+            return self._cached_object
+        self._cached_object = get_object_or_404(
+            get_post_detail(self.model.objects).filter(
+                Q(author=self.request.user)
+                | Q(
+                    is_published=True,
+                    pub_date__lte=now(),
+                    category__is_published=True
+                )
             ),
             id=self.kwargs['post_id'],
         )
+        return self._cached_object
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['form'] = CommentForm()
-        context['comments'] = (
-            self.get_object().comments.select_related('author')
+        paginator = KeysetPaginator(
+            self.object.comments.select_related('author'),
+            settings.COMMENTS_ON_THE_PAGE,
+            date_field='created_at',
         )
+        try:
+            comments_page = paginator.page(
+                after=self.request.GET.get('comments_before'),
+                before=self.request.GET.get('comments_after'),
+            )
+        except InvalidCursor:
+            raise Http404('Неверный курсор комментариев')
+        context['comments_page'] = comments_page
+        context['comments'] = comments_page.object_list[::-1]
         return context
 
 
-class CategoryPostsView(ListView):
+@method_decorator(
+    (cache_page(settings.PAGE_CACHE_TIMEOUT, cache='pages'), vary_on_cookie),
+    name='dispatch'
+)
+class CategoryPostsView(KeysetPaginationMixin, ListView):
     """Категория публикаций"""
 
     model = Post
     paginate_by = 10
     template_name = 'blog/category.html'
 
+    def get(self, request, *args, **kwargs):
+        self.category = get_object_or_404(
+            Category.objects.only('id', 'title', 'slug', 'description'),
+            is_published=True,
+            slug=self.kwargs['category_slug'],
+        )
+        return super().get(request, *args, **kwargs)
+
     def get_queryset(self):
-        return get_post(Post.objects).filter(
-            category__slug=self.kwargs['category_slug'],
-        ).annotate(comment_count=Count('comments')).order_by('-pub_date')
+        return get_post_list(Post.objects).filter(category=self.category)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['category'] = get_object_or_404(
-            Category,
-            is_published=True,
-            slug=self.kwargs['category_slug'],
-        )
+        context['category'] = self.category
         return context
 
 
@@ -106,29 +205,32 @@ class ProfileEditView(LoginRequiredMixin, UpdateView):
         return self.request.user
 
     def get_success_url(self):
-        return reverse('blog:profile', kwargs={'username': self.request.user})
+        return _profile_url(self.request.user.username)
 
 
-class ProfileListView(ListView):
+class ProfileListView(KeysetPaginationMixin, ListView):
     """Страница пользователя"""
 
     model = Post
     paginate_by = 10
     template_name = 'blog/profile.html'
 
+    @cached_property
+    def author(self):
+        try:
+            return User.objects.only(
+                'id', 'username', 'first_name', 'last_name',
+                'date_joined', 'is_staff',
+            ).get(username=self.kwargs['username'])
+        except User.DoesNotExist:
+            raise Http404
+
     def get_queryset(self):
-        self.author = get_object_or_404(User, username=self.kwargs['username'])
-        return Post.objects.select_related(
-            'author', 'location', 'category',
-        ).filter(
-            author=self.author
-        ).annotate(comment_count=Count('comments')).order_by('-pub_date')
+        return get_post_cards(Post.objects).filter(author=self.author)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['profile'] = get_object_or_404(
-            User, username=self.kwargs['username'],
-        )
+        context['profile'] = self.author
         return context
 
 
@@ -144,7 +246,7 @@ class PostCreateView(LoginRequiredMixin, CreateView):
         return super().form_valid(form)
 
     def get_success_url(self):
-        return reverse('blog:profile', kwargs={'username': self.request.user})
+        return _profile_url(self.request.user.username)
 
 
 class PostEditView(LoginRequiredMixin, PostMixin, DispatchMixin, UpdateView):
@@ -153,7 +255,7 @@ class PostEditView(LoginRequiredMixin, PostMixin, DispatchMixin, UpdateView):
     form_class = PostForm
 
     def get_success_url(self):
-        return reverse('blog:post_detail', args=(self.kwargs['post_id'],))
+        return _post_detail_url(self.kwargs['post_id'])
 
 
 class PostDeleteView(LoginRequiredMixin, PostMixin, DispatchMixin, DeleteView):
@@ -161,6 +263,11 @@ class PostDeleteView(LoginRequiredMixin, PostMixin, DispatchMixin, DeleteView):
 
     success_url = reverse_lazy('blog:index')
 
+    def delete(self, request, *args, **kwargs):
+        response = super().delete(request, *args, **kwargs)
+        clear_pages_cache()
+        return response
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['form'] = PostForm(instance=self.object)
@@ -173,54 +280,40 @@ class CreateCommentView(LoginRequiredMixin, CreateView):
     model = Comment
     form_class = CommentForm
     template_name = 'blog/comment.html'
-    post_obj = None
 
     def dispatch(self, request, *args, **kwargs):
-        self.post_obj = get_object_or_404(
-            Post, id=self.kwargs['post_id']
-        )
+        if not Post.objects.filter(pk=self.kwargs['post_id']).exists():
+            raise Http404
         return super().dispatch(request, *args, **kwargs)
 
     def form_valid(self, form):
-        form.instance.comments = self.post_obj
+        form.instance.comments_id = self.kwargs['post_id']
         form.instance.author = self.request.user
-        return super().form_valid(form)
+        with transaction.atomic():
+            response = super().form_valid(form)
+            Post.objects.filter(pk=self.kwargs['post_id']).update(
+                comment_count=F('comment_count') + 1
+            )
+        return response
 
     def get_success_url(self) -> str:
-        return reverse('blog:post_detail',
-                       kwargs={'post_id': self.kwargs['post_id']})
+        return _post_detail_url(self.kwargs['post_id'])
 
 
-class CommentEditView(UpdateView):
+class CommentEditView(CommentMixin, UpdateView):
     """Редактирование комментария"""
 
-    model = Comment
-    template_name = 'blog/comment.html'
-    pk_url_kwarg = 'comment_id'
     form_class = CommentForm
 
-    def dispatch(self, request, *args, **kwargs):
-        if self.get_object().author != request.user:
-            return redirect('blog:post_detail',
-                            post_id=self.kwargs['comment_id'])
-        return super().dispatch(request, *args, **kwargs)
-
-    def get_success_url(self):
-        return reverse('blog:post_detail', args=(self.kwargs['comment_id'],))
 
-
-class CommentDeleteView(DeleteView):
+class CommentDeleteView(CommentMixin, DeleteView):
     """Удаление комментария"""
 
-    model = Comment
-    template_name = 'blog/comment.html'
-    pk_url_kwarg = 'comment_id'
-
-    def dispatch(self, request, *args, **kwargs):
-        if self.get_object().author != request.user:
-            return redirect('blog:post_detail',
-                            post_id=self.kwargs['comment_id'])
-        return super().dispatch(request, *args, **kwargs)
-
-    def get_success_url(self):
-        return reverse('blog:post_detail', args=(self.kwargs['comment_id'],))
+    def delete(self, request, *args, **kwargs):
+        with transaction.atomic():
+            response = super().delete(request, *args, **kwargs)
+            Post.objects.filter(
+                pk=self.object.comments_id, comment_count__gt=0
+            ).update(comment_count=F('comment_count') - 1)
+        clear_pages_cache()
+        return response
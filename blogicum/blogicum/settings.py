@@ -94,10 +94,33 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'CONN_MAX_AGE': 60,
     }
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/3.2/topics/cache/
+# LocMemCache живёт в памяти одного процесса: сигналы и view очищают
+# 'pages' только в текущем воркере, в остальных записи доживают до
+# истечения таймаута. 'fragments' хранит карточки публикаций и не
+# очищается: всё, что показывает карточка, входит в ключ фрагмента.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'pages': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'pages',
+    },
+    'fragments': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'fragments',
+    },
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/3.2/ref/settings/#auth-password-validators
 
@@ -160,5 +183,7 @@ CSRF_FAILURE_VIEW = 'pages.views.csrf_failure'
 
 MAX_FIELD_LENGHT = 256
 POSTS_ON_THE_PAGE = 10
+COMMENTS_ON_THE_PAGE = 50
+PAGE_CACHE_TIMEOUT = 60
 DATE_FORMAT = '%Y-%m-%dT%H:%M'
 NUMBER_OF_SYMBOLS = 20
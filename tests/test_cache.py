@@ -0,0 +1,139 @@
+from http import HTTPStatus
+
+import pytest
+from django.core.cache import caches
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    for alias in ("default", "pages", "fragments"):
+        caches[alias].clear()
+
+
+@pytest.mark.parametrize("url_name", ("index", "category"))
+def test_cached_page_not_shared_between_users(
+    user, user_client, unlogged_client, post_with_published_location,
+    url_name
+):
+    post = post_with_published_location
+    url = {
+        "index": "/",
+        "category": f"/category/{post.category.slug}/",
+    }[url_name]
+    user_header = user_client.get(url).content.decode("utf-8")
+    assert f"/profile/{user.username}/" in user_header
+
+    response = unlogged_client.get(url)
+    assert response.status_code == HTTPStatus.OK
+    anonymous_page = response.content.decode("utf-8")
+    assert "Выйти" not in anonymous_page, (
+        "Убедитесь, что закешированная страница залогиненного пользователя"
+        " не отдаётся анонимному посетителю."
+    )
+    assert "Войти" in anonymous_page
+
+
+def test_profile_reflects_user_changes(user, unlogged_client):
+    from django.contrib.auth import get_user_model
+
+    unlogged_client.get(f"/profile/{user.username}/")
+    get_user_model().objects.filter(pk=user.pk).update(first_name="Изменено")
+    response = unlogged_client.get(f"/profile/{user.username}/")
+    assert response.context["profile"].first_name == "Изменено", (
+        "Убедитесь, что страница профиля показывает актуальные данные"
+        " пользователя, даже если он изменён в другом процессе."
+    )
+
+
+@pytest.mark.parametrize("url_name", ("index", "category"))
+def test_cached_page_shows_renamed_author(
+    user, unlogged_client, post_with_published_location, url_name
+):
+    post = post_with_published_location
+    url = {
+        "index": "/",
+        "category": f"/category/{post.category.slug}/",
+    }[url_name]
+    assert f"@{user.username}" in unlogged_client.get(url).content.decode()
+
+    user.username = f"{user.username}renamed"
+    user.save()
+    page = unlogged_client.get(url).content.decode("utf-8")
+    assert f"@{user.username}" in page, (
+        "Убедитесь, что после изменения имени автора закешированные"
+        " страницы показывают новое имя."
+    )
+
+
+@pytest.mark.parametrize("url_name", ("index", "category"))
+def test_cached_page_drops_deleted_post(
+    user_client, unlogged_client, post_with_published_location, url_name
+):
+    post = post_with_published_location
+    url = {
+        "index": "/",
+        "category": f"/category/{post.category.slug}/",
+    }[url_name]
+    assert post.title in unlogged_client.get(url).content.decode("utf-8")
+
+    user_client.post(f"/posts/{post.id}/delete/")
+    page = unlogged_client.get(url).content.decode("utf-8")
+    assert post.title not in page, (
+        "Убедитесь, что после удаления публикации закешированные"
+        " страницы её больше не показывают."
+    )
+
+
+@pytest.mark.parametrize("url_name", ("index", "category"))
+def test_cached_card_shows_renamed_location(
+    unlogged_client, post_with_published_location, url_name
+):
+    post = post_with_published_location
+    url = {
+        "index": "/",
+        "category": f"/category/{post.category.slug}/",
+    }[url_name]
+    unlogged_client.get(url)
+
+    post.location.name = "Переименованное место"
+    post.location.save()
+    page = unlogged_client.get(url).content.decode("utf-8")
+    assert "Переименованное место" in page, (
+        "Убедитесь, что закешированная карточка публикации показывает"
+        " актуальное название местоположения."
+    )
+
+
+def test_new_comment_keeps_cached_cards(
+    mixer, user, user_client, unlogged_client, post_with_published_location
+):
+    from django.core.cache.utils import make_template_fragment_key
+
+    from blog.models import Post
+
+    card_post = Post.objects.get(pk=post_with_published_location.pk)
+    commented_post = mixer.blend(
+        "blog.Post",
+        author=user,
+        is_published=True,
+        category=card_post.category,
+        location=card_post.location,
+    )
+    card_key = make_template_fragment_key("post_card", (
+        card_post.id, card_post.updated_at, card_post.comment_count,
+        card_post.author.username, card_post.category.title,
+        card_post.category.slug, card_post.location.name,
+        card_post.location.is_published,
+    ))
+    unlogged_client.get("/")
+    assert caches["fragments"].get(card_key) is not None
+
+    user_client.post(
+        f"/posts/{commented_post.id}/comment/", data={"text": "Комментарий"}
+    )
+    assert caches["fragments"].get(card_key) is not None, (
+        "Убедитесь, что добавление комментария не сбрасывает"
+        " закешированные карточки других публикаций."
+    )
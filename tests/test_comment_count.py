@@ -0,0 +1,101 @@
+from importlib import import_module
+
+import pytest
+from django.apps import apps
+
+pytestmark = [pytest.mark.django_db]
+
+
+def _comment_count(post):
+    post.refresh_from_db(fields=["comment_count"])
+    return post.comment_count
+
+
+def test_comment_count_follows_comments(
+    user_client, post_with_published_location
+):
+    post = post_with_published_location
+    for i in range(3):
+        user_client.post(
+            f"/posts/{post.id}/comment/", data={"text": f"Комментарий {i}"}
+        )
+    assert _comment_count(post) == 3, (
+        "Убедитесь, что счётчик комментариев публикации увеличивается"
+        " при добавлении комментария."
+    )
+
+    first, second, _ = post.comments.order_by("id")
+    user_client.post(
+        f"/posts/{post.id}/{first.id}/eit_comment/",
+        data={"text": "Изменённый комментарий"},
+    )
+    assert _comment_count(post) == 3, (
+        "Убедитесь, что редактирование комментария не меняет счётчик"
+        " комментариев публикации."
+    )
+
+    user_client.post(f"/posts/{post.id}/delete_comment/{second.id}/")
+    assert _comment_count(post) == 2, (
+        "Убедитесь, что счётчик комментариев публикации уменьшается"
+        " при удалении комментария."
+    )
+
+
+def test_post_delete_queries_do_not_grow_with_comments(mixer, user):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    query_counts = []
+    for n_comments in (2, 20):
+        post = mixer.blend("blog.Post", author=user)
+        mixer.cycle(n_comments).blend(
+            "blog.Comment", comments=post, author=user
+        )
+        with CaptureQueriesContext(connection) as queries:
+            post.delete()
+        query_counts.append(len(queries))
+    assert query_counts[0] == query_counts[1], (
+        "Убедитесь, что удаление публикации выполняет одинаковое число"
+        " запросов независимо от количества её комментариев."
+    )
+
+
+def test_comment_count_backfill(mixer, user, post_with_published_location):
+    from blog.models import Post
+
+    post = post_with_published_location
+    other_post = mixer.blend("blog.Post", author=user)
+    mixer.cycle(2).blend("blog.Comment", comments=post, author=user)
+    Post.objects.update(comment_count=7)
+
+    migration = import_module(
+        "blog.migrations.0016_backfill_post_comment_count"
+    )
+    migration.backfill_comment_count(apps, None)
+
+    assert _comment_count(post) == 2
+    assert _comment_count(other_post) == 0, (
+        "Убедитесь, что миграция заполняет счётчик комментариев нулём"
+        " у публикаций без комментариев."
+    )
+
+
+def test_post_save_keeps_concurrent_comment_count(
+    user_client, post_with_published_location
+):
+    from blog.models import Post
+
+    post = post_with_published_location
+    loaded = Post.objects.get(pk=post.pk)
+    user_client.post(
+        f"/posts/{post.id}/comment/", data={"text": "Комментарий"}
+    )
+    loaded.title = "Изменённый заголовок"
+    loaded.save()
+
+    post.refresh_from_db()
+    assert post.title == "Изменённый заголовок"
+    assert post.comment_count == post.comments.count() == 1, (
+        "Убедитесь, что сохранение публикации не затирает счётчик"
+        " комментариев, изменённый после её загрузки."
+    )
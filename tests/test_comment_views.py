@@ -0,0 +1,104 @@
+from http import HTTPStatus
+
+import pytest
+from bs4 import BeautifulSoup
+from django.test import override_settings
+
+pytestmark = [pytest.mark.django_db]
+
+N_COMMENTS_PER_PAGE = 5
+
+
+def _comment_link(response, cursor_kwarg):
+    soup = BeautifulSoup(response.content.decode("utf-8"), "html.parser")
+    for link in soup.find_all("a", href=True):
+        if link["href"].startswith(f"?{cursor_kwarg}="):
+            return link["href"]
+    return None
+
+
+@override_settings(COMMENTS_ON_THE_PAGE=N_COMMENTS_PER_PAGE)
+def test_older_comments_reachable(
+    mixer, user, user_client, post_with_published_location
+):
+    post = post_with_published_location
+    comment_ids = [
+        mixer.blend("blog.Comment", comments=post, author=user).id
+        for _ in range(N_COMMENTS_PER_PAGE + 2)
+    ]
+    url = f"/posts/{post.id}/"
+
+    response = user_client.get(url)
+    assert [c.id for c in response.context["comments"]] == (
+        comment_ids[-N_COMMENTS_PER_PAGE:]
+    ), (
+        "Убедитесь, что на странице публикации показываются последние"
+        " комментарии в порядке их создания."
+    )
+    older_query = _comment_link(response, "comments_before")
+    assert older_query, (
+        "Убедитесь, что на странице публикации есть ссылка на более ранние"
+        " комментарии, если показаны не все."
+    )
+
+    response = user_client.get(url + older_query)
+    assert [c.id for c in response.context["comments"]] == comment_ids[:2]
+    assert _comment_link(response, "comments_before") is None
+
+    newer_query = _comment_link(response, "comments_after")
+    response = user_client.get(url + newer_query)
+    assert [c.id for c in response.context["comments"]] == (
+        comment_ids[-N_COMMENTS_PER_PAGE:]
+    )
+
+
+def test_malformed_comment_cursor_returns_404(
+    user_client, post_with_published_location
+):
+    response = user_client.get(
+        f"/posts/{post_with_published_location.id}/?comments_before=x"
+    )
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+@pytest.mark.parametrize("action", ("edit", "delete"))
+def test_non_author_redirected_to_post(
+    mixer, user, another_user_client, post_with_published_location, action
+):
+    from blog.models import Comment
+
+    post = post_with_published_location
+    comment = mixer.blend(
+        "blog.Comment", comments=post, author=user, text="Исходный текст"
+    )
+    url = {
+        "edit": f"/posts/{post.id}/{comment.id}/eit_comment/",
+        "delete": f"/posts/{post.id}/delete_comment/{comment.id}/",
+    }[action]
+
+    for response in (
+        another_user_client.get(url),
+        another_user_client.post(url, {"text": "Чужой текст"}),
+    ):
+        assert response.status_code == HTTPStatus.FOUND
+        assert response.url == f"/posts/{post.id}/", (
+            "Убедитесь, что пользователь, пытающийся изменить чужой"
+            " комментарий, перенаправляется на страницу публикации."
+        )
+    comment = Comment.objects.get(pk=comment.pk)
+    assert comment.text == "Исходный текст"
+
+
+@pytest.mark.parametrize("action", ("edit", "delete"))
+def test_missing_comment_returns_404(
+    user_client, post_with_published_location, action
+):
+    post = post_with_published_location
+    url = {
+        "edit": f"/posts/{post.id}/404/eit_comment/",
+        "delete": f"/posts/{post.id}/delete_comment/404/",
+    }[action]
+    assert user_client.get(url).status_code == HTTPStatus.NOT_FOUND, (
+        "Убедитесь, что при обращении к несуществующему комментарию"
+        " возвращается статус 404."
+    )
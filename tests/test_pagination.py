@@ -0,0 +1,139 @@
+from datetime import timedelta
+from http import HTTPStatus
+
+import pytest
+from bs4 import BeautifulSoup
+from django.core.cache import caches
+from django.utils import timezone
+
+from conftest import N_PER_PAGE
+
+pytestmark = [pytest.mark.django_db]
+
+N_POSTS = N_PER_PAGE * 2 + 5
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    for alias in ("default", "pages", "fragments"):
+        caches[alias].clear()
+
+
+@pytest.fixture
+def posts_with_same_pub_date(mixer, user, published_category):
+    same_date = timezone.now() - timedelta(days=1)
+    pub_dates = (
+        same_date if i % 2 else same_date - timedelta(hours=i)
+        for i in range(N_POSTS)
+    )
+    return mixer.cycle(N_POSTS).blend(
+        "blog.Post",
+        author=user,
+        is_published=True,
+        category=published_category,
+        location=None,
+        pub_date=pub_dates,
+    )
+
+
+def _page_link(response, cursor_kwarg):
+    soup = BeautifulSoup(response.content.decode("utf-8"), "html.parser")
+    for link in soup.find_all("a", href=True):
+        if link["href"].startswith(f"?{cursor_kwarg}="):
+            return link["href"]
+    return None
+
+
+def _walk(client, url, cursor_kwarg, first_query=""):
+    pages = []
+    query = first_query
+    while query is not None:
+        response = client.get(url + query)
+        assert response.status_code == HTTPStatus.OK, (
+            "Убедитесь, что страницы ленты по курсору загружаются без ошибок."
+        )
+        pages.append(
+            (query, [post.id for post in response.context["page_obj"]])
+        )
+        query = _page_link(response, cursor_kwarg)
+    return pages
+
+
+def test_cursor_round_trip(mixer, user):
+    from blog.paginators import decode_cursor, encode_cursor
+
+    post = mixer.blend(
+        "blog.Post",
+        author=user,
+        pub_date=timezone.now().replace(microsecond=123456),
+    )
+    assert decode_cursor(encode_cursor(post)) == (post.pub_date, post.id), (
+        "Убедитесь, что курсор страницы однозначно восстанавливает"
+        " дату публикации и id поста."
+    )
+
+
+@pytest.mark.parametrize("url_name", ("index", "category", "profile"))
+def test_cursor_walks_forward_and_back(
+    client, user, published_category, posts_with_same_pub_date, url_name
+):
+    url = {
+        "index": "/",
+        "category": f"/category/{published_category.slug}/",
+        "profile": f"/profile/{user.username}/",
+    }[url_name]
+
+    forward = _walk(client, url, "after")
+    post_ids = [post_id for _, page in forward for post_id in page]
+    assert sorted(post_ids) == sorted(
+        post.id for post in posts_with_same_pub_date
+    ), (
+        "Убедитесь, что при переходе по страницам ленты каждая публикация"
+        " показывается ровно один раз, в том числе при совпадающей дате"
+        " публикации."
+    )
+    assert [len(page) for _, page in forward] == [N_PER_PAGE, N_PER_PAGE, 5]
+
+    last_query, _ = forward[-1]
+    previous_query = _page_link(client.get(url + last_query), "before")
+    backward = _walk(client, url, "before", previous_query)
+    assert [page for _, page in backward] == [
+        page for _, page in forward[-2::-1]
+    ], (
+        "Убедитесь, что ссылка на предыдущую страницу ленты возвращает"
+        " те же публикации, что были на ней при переходе вперёд."
+    )
+
+
+@pytest.mark.parametrize(
+    "query", ("?after=zzz", "?after=1_2_3", "?before=abc_1")
+)
+def test_malformed_cursor_returns_404(client, posts_with_same_pub_date, query):
+    response = client.get("/" + query)
+    assert response.status_code == HTTPStatus.NOT_FOUND, (
+        "Убедитесь, что при некорректном курсоре страницы"
+        " возвращается статус 404."
+    )
+
+
+@pytest.mark.parametrize("url_name", ("index", "profile"))
+def test_numbered_pages_share_cached_count(
+    client, user, posts_with_same_pub_date, monkeypatch, url_name
+):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    from blog.paginators import CachedCountPaginator
+
+    monkeypatch.setattr(CachedCountPaginator, "count_cache_threshold", 0)
+    url = {"index": "/", "profile": f"/profile/{user.username}/"}[url_name]
+
+    client.get(url + "?page=1")
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(url + "?page=2")
+    assert response.status_code == HTTPStatus.OK
+    assert len(response.context["page_obj"]) == N_PER_PAGE
+    assert not any("COUNT(" in query["sql"] for query in queries), (
+        "Убедитесь, что количество публикаций для постраничной навигации"
+        " берётся из кеша при повторных запросах."
+    )